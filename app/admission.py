@@ -0,0 +1,139 @@
+import asyncio
+import os
+import time
+from typing import Callable, Dict, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class OverloadedError(Exception):
+    """Raised when a write is rejected by admission control."""
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._last = clock()
+
+    @property
+    def last_used(self) -> float:
+        """Clock time of the last acquire attempt."""
+        return self._last
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take `tokens` from the bucket if available."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+
+class WriteAdmission:
+    """Admission control for database writes.
+
+    Each client gets its own token bucket, and all clients share a cap on concurrent
+    writes. Writes beyond the cap wait in a bounded queue; once the queue is full,
+    further writes are rejected instead of piling up on the event loop. Buckets idle
+    for longer than `bucket_ttl` seconds are evicted.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5,
+        burst: float = 10,
+        max_concurrent: int = 5,
+        max_queue: int = 20,
+        bucket_ttl: float = 600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.bucket_ttl = bucket_ttl
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._last_sweep = clock()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._in_flight = 0
+        self._waiting = 0
+        self.rejected_total = 0
+
+    @classmethod
+    def from_env(cls) -> "WriteAdmission":
+        """Create an admission controller configured by the APP_WRITE_* environment variables."""
+        return cls(
+            rate=float(os.environ.get("APP_WRITE_RATE", "5")),
+            burst=float(os.environ.get("APP_WRITE_BURST", "10")),
+            max_concurrent=int(os.environ.get("APP_WRITE_MAX_CONCURRENT", "5")),
+            max_queue=int(os.environ.get("APP_WRITE_MAX_QUEUE", "20")),
+            bucket_ttl=float(os.environ.get("APP_WRITE_BUCKET_TTL", "600")),
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of writes waiting for a free slot."""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Number of writes currently running."""
+        return self._in_flight
+
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of the admission counters."""
+        return {
+            "write_queue_depth": self.queue_depth,
+            "write_in_flight": self.in_flight,
+            "write_rejected_total": self.rejected_total,
+        }
+
+    def _sweep(self, now: float) -> None:
+        if now - self._last_sweep < self.bucket_ttl:
+            return
+        self._last_sweep = now
+        for client_id, bucket in list(self._buckets.items()):
+            if now - bucket.last_used >= self.bucket_ttl:
+                del self._buckets[client_id]
+
+    def _admit(self, client_id: str) -> None:
+        # Check capacity first so a write rejected as busy does not spend the client's budget
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self.rejected_total += 1
+            raise OverloadedError("Server is busy, please slow down")
+
+        self._sweep(self._clock())
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = self._buckets[client_id] = TokenBucket(self.rate, self.burst, self._clock)
+
+        if not bucket.try_acquire():
+            self.rejected_total += 1
+            raise OverloadedError("Too many changes, please slow down")
+
+    async def run(self, client_id: str, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a blocking write in a worker thread once it has been admitted."""
+        self._admit(client_id)
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
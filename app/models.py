@@ -1,19 +1,79 @@
+from sqlalchemy import DDL, DateTime, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlmodel import SQLModel, Field
 from datetime import datetime
 from typing import Optional
 
 
+# Current UTC time as naive timestamps, the single source for column defaults, onupdate and triggers
+PG_UTCNOW = "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+SQLITE_UTCNOW = "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return PG_UTCNOW
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    return f"({SQLITE_UTCNOW})"
+
+
 class TodoItem(SQLModel, table=True):
     """Todo item model for storing tasks in the database."""
 
     __tablename__ = "todo_items"  # type: ignore[assignment]
+    # Fetch server-generated timestamps with RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200)
     description: str = Field(default="", max_length=1000)
     completed: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Naive UTC on every backend, as produced by utcnow(); None until the row is inserted
+    created_at: datetime = Field(
+        default=None, sa_type=DateTime(), sa_column_kwargs={"server_default": utcnow(), "nullable": False}
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_type=DateTime(),
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow(), "nullable": False},
+    )
+
+
+# ORM updates set updated_at through onupdate; the triggers cover writes made outside the ORM.
+# app.database.upgrade_tables() reuses them to add the trigger to tables created by older versions.
+PG_UPDATED_AT_FUNCTION = DDL(
+    "CREATE OR REPLACE FUNCTION todo_items_set_updated_at() RETURNS TRIGGER AS $$ "
+    f"BEGIN NEW.updated_at = {PG_UTCNOW}; RETURN NEW; END; "
+    "$$ LANGUAGE plpgsql"
+)
+PG_UPDATED_AT_TRIGGER = DDL(
+    "CREATE OR REPLACE TRIGGER todo_items_updated_at BEFORE UPDATE ON todo_items "
+    "FOR EACH ROW EXECUTE FUNCTION todo_items_set_updated_at()"
+)
+# SQLite triggers cannot modify NEW, so the row is touched again unless the update already set it
+SQLITE_UPDATED_AT_TRIGGER = DDL(
+    "CREATE TRIGGER IF NOT EXISTS todo_items_updated_at AFTER UPDATE ON todo_items "
+    "FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+    # DDL applies %-formatting, so the literal % signs are escaped
+    f"BEGIN UPDATE todo_items SET updated_at = {SQLITE_UTCNOW.replace('%', '%%')} "
+    "WHERE id = NEW.id; END"
+)
+
+todo_items_table = TodoItem.__table__  # type: ignore[attr-defined]
+event.listen(todo_items_table, "after_create", PG_UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(todo_items_table, "after_create", PG_UPDATED_AT_TRIGGER.execute_if(dialect="postgresql"))
+event.listen(todo_items_table, "after_create", SQLITE_UPDATED_AT_TRIGGER.execute_if(dialect="sqlite"))
 
 
 class TodoItemCreate(SQLModel, table=False):
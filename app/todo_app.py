@@ -1,7 +1,17 @@
-from nicegui import ui
+from nicegui import app, ui
+from app.admission import OverloadedError, WriteAdmission
 from app.todo_service import TodoService
 from app.models import TodoItemCreate
 
+# Replaced in create() so each app start gets fresh admission state bound to its event loop
+admission = WriteAdmission()
+
+
+@app.get("/metrics")
+def metrics():
+    """Expose write admission counters."""
+    return admission.metrics()
+
 
 def create():
     """Create the todo application pages."""
@@ -17,12 +27,17 @@ def create():
         info="#3b82f6",  # Info blue
     )
 
+    global admission
+    admission = WriteAdmission.from_env()
     todo_service = TodoService()
 
     @ui.page("/")
     def todo_page():
         """Main todo application page."""
 
+        # Rate limit per browser rather than per tab or connection
+        browser_id = app.storage.browser["id"]
+
         # Page header
         with ui.row().classes("w-full justify-center mb-8"):
             ui.label("📝 Todo App").classes("text-4xl font-bold text-primary")
@@ -34,7 +49,12 @@ def create():
                 ui.label("Add New Todo").classes("text-xl font-bold mb-4 text-gray-800")
 
                 with ui.row().classes("w-full gap-4"):
-                    title_input = ui.input(placeholder="Enter todo title...").classes("flex-1").props("outlined dense")
+                    title_input = (
+                        ui.input(placeholder="Enter todo title...")
+                        .classes("flex-1")
+                        .props("outlined dense")
+                        .mark("title_input")
+                    )
 
                     description_input = (
                         ui.input(placeholder="Description (optional)...").classes("flex-1").props("outlined dense")
@@ -47,10 +67,12 @@ def create():
             # Todo list container
             todo_list_container = ui.column().classes("w-full gap-4")
 
-            def refresh_todos():
+            # Checkboxes whose value is being reset and whose change handler must not fire
+            resetting_checkboxes = set()
+
+            def refresh_todos(todos):
                 """Refresh the todo list display."""
                 todo_list_container.clear()
-                todos = todo_service.get_all_todos()
 
                 if not todos:
                     with todo_list_container:
@@ -69,7 +91,7 @@ def create():
                         # Completion checkbox
                         ui.checkbox(
                             value=todo.completed,
-                            on_change=lambda e, todo_id=todo.id: toggle_completion(todo_id) if todo_id else None,
+                            on_change=lambda e, todo_id=todo.id: on_toggle(e, todo_id) if todo_id else None,
                         ).classes("flex-shrink-0")
 
                         # Todo content
@@ -100,6 +122,16 @@ def create():
                                 "🗑️", on_click=lambda e, todo_id=todo.id: delete_todo(todo_id) if todo_id else None
                             ).classes("text-red-500 hover:bg-red-50 rounded-full p-2").props("flat dense")
 
+            async def write(func, *args):
+                """Run a write and reload the list in one admitted worker call."""
+
+                def write_and_list():
+                    return func(*args), todo_service.get_all_todos()
+
+                result, todos = await admission.run(browser_id, write_and_list)
+                refresh_todos(todos)
+                return result
+
             async def add_todo():
                 """Add a new todo item."""
                 title = title_input.value.strip()
@@ -111,26 +143,38 @@ def create():
 
                 try:
                     todo_data = TodoItemCreate(title=title, description=description)
-                    todo_service.create_todo(todo_data)
+                    await write(todo_service.create_todo, todo_data)
 
                     # Clear inputs
                     title_input.set_value("")
                     description_input.set_value("")
 
-                    # Refresh the list
-                    refresh_todos()
-
                     ui.notify("Todo added successfully!", type="positive")
 
+                except OverloadedError as e:
+                    ui.notify(str(e), type="warning")
                 except Exception as e:
                     ui.notify(f"Error adding todo: {str(e)}", type="negative")
 
-            def toggle_completion(todo_id: int):
+            def on_toggle(e, todo_id: int):
+                """Handle a checkbox change unless it comes from resetting a rejected toggle."""
+                if e.sender.id in resetting_checkboxes:
+                    return None
+                return toggle_completion(e.sender, todo_id)
+
+            async def toggle_completion(checkbox, todo_id: int):
                 """Toggle the completion status of a todo."""
                 try:
-                    todo_service.toggle_todo_completion(todo_id)
-                    refresh_todos()
+                    await write(todo_service.toggle_todo_completion, todo_id)
                     ui.notify("Todo updated!", type="positive")
+                except OverloadedError as e:
+                    # Undo the click locally instead of re-querying the list
+                    resetting_checkboxes.add(checkbox.id)
+                    try:
+                        checkbox.set_value(not checkbox.value)
+                    finally:
+                        resetting_checkboxes.discard(checkbox.id)
+                    ui.notify(str(e), type="warning")
                 except Exception as e:
                     ui.notify(f"Error updating todo: {str(e)}", type="negative")
 
@@ -148,12 +192,13 @@ def create():
 
                 if result == "delete":
                     try:
-                        success = todo_service.delete_todo(todo_id)
+                        success = await write(todo_service.delete_todo, todo_id)
                         if success:
-                            refresh_todos()
                             ui.notify("Todo deleted successfully!", type="positive")
                         else:
                             ui.notify("Todo not found", type="warning")
+                    except OverloadedError as e:
+                        ui.notify(str(e), type="warning")
                     except Exception as e:
                         ui.notify(f"Error deleting todo: {str(e)}", type="negative")
 
@@ -162,4 +207,4 @@ def create():
             description_input.on("keydown.enter", lambda: add_todo())
 
             # Initial load
-            refresh_todos()
+            refresh_todos(todo_service.get_all_todos())
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 from sqlmodel import select, desc
 from app.database import get_session
@@ -14,7 +13,6 @@ class TodoService:
             todo = TodoItem(**todo_data.model_dump())
             session.add(todo)
             session.commit()
-            session.refresh(todo)
             return todo
 
     def get_all_todos(self) -> List[TodoItem]:
@@ -41,10 +39,8 @@ class TodoService:
             for field, value in update_dict.items():
                 setattr(todo, field, value)
 
-            todo.updated_at = datetime.utcnow()
             session.add(todo)
             session.commit()
-            session.refresh(todo)
             return todo
 
     def toggle_todo_completion(self, todo_id: int) -> Optional[TodoItem]:
@@ -55,10 +51,8 @@ class TodoService:
                 return None
 
             todo.completed = not todo.completed
-            todo.updated_at = datetime.utcnow()
             session.add(todo)
             session.commit()
-            session.refresh(todo)
             return todo
 
     def delete_todo(self, todo_id: int) -> bool:
@@ -1,6 +1,7 @@
 from typing import Generator
 import pytest
 from app.startup import startup
+from nicegui import Client
 from nicegui.testing import User
 
 pytest_plugins = ['nicegui.testing.plugin']
@@ -8,5 +9,7 @@ pytest_plugins = ['nicegui.testing.plugin']
 
 @pytest.fixture
 def user(user: User) -> Generator[User, None, None]:
-    startup()
+    # startup() creates UI (e.g. ui.colors), which needs a client slot outside the test body
+    with Client.auto_index_client:
+        startup()
     yield user
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import pytest
+from app.admission import OverloadedError, TokenBucket, WriteAdmission
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic refills."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_burst_and_refill():
+    """Test that the bucket allows a burst and then refills over time."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    # Half a second at 2 tokens/s refills one token
+    clock.now = 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    # Refill never exceeds capacity
+    clock.now = 100.0
+    for _ in range(3):
+        assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+async def test_rate_limit_is_per_client():
+    """Test that one client exhausting its bucket does not affect others."""
+    admission = WriteAdmission(rate=1, burst=2, clock=FakeClock())
+
+    assert await admission.run("a", lambda: 1) == 1
+    assert await admission.run("a", lambda: 2) == 2
+    with pytest.raises(OverloadedError):
+        await admission.run("a", lambda: 3)
+
+    assert await admission.run("b", lambda: 4) == 4
+    assert admission.rejected_total == 1
+
+
+async def test_idle_buckets_are_evicted():
+    """Test that buckets idle for longer than the TTL are dropped, and active ones kept."""
+    clock = FakeClock()
+    admission = WriteAdmission(rate=1, burst=1, bucket_ttl=60, clock=clock)
+
+    await admission.run("idle", lambda: None)
+    clock.now = 30.0
+    await admission.run("active", lambda: None)
+    assert set(admission._buckets) == {"idle", "active"}
+
+    clock.now = 61.0
+    await admission.run("other", lambda: None)
+    assert set(admission._buckets) == {"active", "other"}
+
+
+async def test_bounded_queue_rejects_when_full():
+    """Test concurrency cap, queue depth reporting and rejection on a full queue."""
+    admission = WriteAdmission(rate=100, burst=100, max_concurrent=1, max_queue=1)
+    release = threading.Event()
+
+    running = asyncio.create_task(admission.run("a", release.wait))
+    await asyncio.sleep(0.05)
+    assert admission.in_flight == 1
+
+    queued = asyncio.create_task(admission.run("b", lambda: "queued"))
+    await asyncio.sleep(0.05)
+    assert admission.queue_depth == 1
+
+    with pytest.raises(OverloadedError):
+        await admission.run("c", lambda: "rejected")
+    # A busy rejection does not spend the client's rate budget
+    assert "c" not in admission._buckets
+
+    release.set()
+    await running
+    assert await queued == "queued"
+    assert admission.metrics() == {"write_queue_depth": 0, "write_in_flight": 0, "write_rejected_total": 1}
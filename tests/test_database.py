@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from app.database import ENGINE, create_tables, reset_db
+from app.models import TodoItemCreate
+from app.todo_service import TodoService
+
+requires_sqlite = pytest.mark.skipif(ENGINE.dialect.name != "sqlite", reason="SQLite table rebuild")
+
+
+def create_old_schema(title_constraint: str = "NOT NULL"):
+    """Replace todo_items with the schema created before timestamps moved to the database."""
+    id_type = "SERIAL" if ENGINE.dialect.name == "postgresql" else "INTEGER"
+    with ENGINE.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS todo_items"))
+        conn.execute(
+            text(
+                f"CREATE TABLE todo_items (id {id_type} PRIMARY KEY, title VARCHAR(200) {title_constraint}, "
+                "description VARCHAR(1000) NOT NULL, completed BOOLEAN NOT NULL, "
+                "created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL)"
+            )
+        )
+
+
+def insert_old_rows(*titles):
+    """Insert rows the way the old application did, with client-side timestamps."""
+    with ENGINE.begin() as conn:
+        for hour, title in enumerate(titles):
+            conn.execute(
+                text(
+                    "INSERT INTO todo_items (title, description, completed, created_at, updated_at) "
+                    "VALUES (:title, '', :completed, :now, :now)"
+                ),
+                {"title": title, "completed": False, "now": datetime(2025, 1, 1, hour)},
+            )
+
+
+@pytest.fixture
+def old_db():
+    """Start from an old-schema table and restore a fresh database afterwards."""
+    create_old_schema()
+    yield
+    with ENGINE.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS todo_items_old"))
+    reset_db()
+
+
+def test_upgrade_keeps_rows(old_db):
+    """Test that upgrading an old-schema table keeps its rows and enables database timestamps."""
+    insert_old_rows("First", "Second")
+
+    create_tables()
+    create_tables()
+
+    todo_service = TodoService()
+    assert [todo.title for todo in todo_service.get_all_todos()] == ["Second", "First"]
+
+    new_todo = todo_service.create_todo(TodoItemCreate(title="New"))
+    assert isinstance(new_todo.created_at, datetime)
+    assert [todo.title for todo in todo_service.get_all_todos()] == ["New", "Second", "First"]
+
+    with ENGINE.begin() as conn:
+        conn.execute(text("UPDATE todo_items SET title = 'Raw' WHERE title = 'First'"))
+    raw_todo = next(todo for todo in todo_service.get_all_todos() if todo.title == "Raw")
+    assert raw_todo.updated_at > datetime(2025, 1, 1, 1)
+
+
+@requires_sqlite
+def test_failed_upgrade_rolls_back(old_db):
+    """Test that a failing copy step leaves the old table and its rows untouched."""
+    create_old_schema(title_constraint="")
+    insert_old_rows("Kept")
+    with ENGINE.begin() as conn:
+        conn.execute(text("UPDATE todo_items SET title = NULL"))
+
+    with pytest.raises(IntegrityError):
+        create_tables()
+
+    tables = inspect(ENGINE).get_table_names()
+    assert "todo_items_old" not in tables
+    with ENGINE.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM todo_items")).scalar() == 1
+
+
+@requires_sqlite
+def test_upgrade_refuses_leftover_table(old_db):
+    """Test that startup fails loudly when an interrupted upgrade left todo_items_old behind."""
+    reset_db()
+    with ENGINE.begin() as conn:
+        conn.execute(text("CREATE TABLE todo_items_old (id INTEGER PRIMARY KEY)"))
+
+    with pytest.raises(RuntimeError, match="todo_items_old"):
+        create_tables()
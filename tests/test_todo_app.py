@@ -1,4 +1,6 @@
 import pytest
+from nicegui import ui
+from nicegui.testing import User
 from app.database import reset_db
 from app.todo_service import TodoService
 from app.models import TodoItemCreate
@@ -12,6 +14,55 @@ def new_db():
     reset_db()
 
 
+@pytest.fixture
+def tight_write_limits(monkeypatch):
+    """Allow a single write per browser with a practically zero refill rate."""
+    monkeypatch.setenv("APP_WRITE_RATE", "0.001")
+    monkeypatch.setenv("APP_WRITE_BURST", "1")
+
+
+async def test_flooding_adds_is_rejected(new_db, tight_write_limits, user: User):
+    """Test that adding faster than the rate limit shows a warning and writes nothing."""
+    await user.open("/")
+
+    user.find("title_input").type("First")
+    user.find("Add Todo").click()
+    await user.should_see("Todo added successfully!")
+
+    user.find("title_input").type("Second")
+    user.find("Add Todo").click()
+    await user.should_see("Too many changes, please slow down")
+
+    assert [todo.title for todo in TodoService().get_all_todos()] == ["First"]
+
+
+async def test_flooding_toggles_resets_checkbox(new_db, tight_write_limits, user: User):
+    """Test that a rejected toggle restores the checkbox without changing the todo."""
+    todo = TodoService().create_todo(TodoItemCreate(title="Flood"))
+    await user.open("/")
+
+    checkbox = user.find(ui.checkbox)
+    checkbox.click()
+    await user.should_see("Todo updated!")
+
+    checkbox = user.find(ui.checkbox)
+    checkbox.click()
+    await user.should_see("Too many changes, please slow down")
+
+    assert all(element.value for element in checkbox.elements)
+    assert todo.id is not None
+    stored = TodoService().get_todo_by_id(todo.id)
+    assert stored is not None and stored.completed
+
+
+async def test_metrics_endpoint(user: User):
+    """Test that /metrics reports the admission counters."""
+    response = await user.http_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json() == {"write_queue_depth": 0, "write_in_flight": 0, "write_rejected_total": 0}
+
+
 def test_todo_service_integration(new_db):
     """Test the todo service integration with database."""
     todo_service = TodoService()
@@ -1,8 +1,10 @@
+import time
 import pytest
 from datetime import datetime
+from sqlalchemy import event, text
 from app.todo_service import TodoService
 from app.models import TodoItemCreate, TodoItemUpdate
-from app.database import reset_db
+from app.database import ENGINE, reset_db
 
 
 @pytest.fixture
@@ -18,6 +20,22 @@ def sample_todo_data():
     return TodoItemCreate(title="Test Todo", description="This is a test todo item")
 
 
+@pytest.fixture
+def statements():
+    """Record the SQL statements sent to the database."""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        keyword = statement.lstrip().split()[0].upper()
+        # Skip the explicit BEGIN the SQLite engine issues for transactional DDL
+        if keyword != "BEGIN":
+            recorded.append(keyword)
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    yield recorded
+    event.remove(ENGINE, "before_cursor_execute", record)
+
+
 def test_create_todo(todo_service, sample_todo_data):
     """Test creating a new todo item."""
     todo = todo_service.create_todo(sample_todo_data)
@@ -223,3 +241,53 @@ def test_long_title_and_description(todo_service):
 
     assert todo.title == long_title
     assert todo.description == long_description
+
+
+def test_create_todo_does_not_reload(todo_service, sample_todo_data, statements):
+    """Test that creating a todo fetches generated values without a follow-up SELECT."""
+    todo_service.create_todo(sample_todo_data)
+
+    assert statements == ["INSERT"]
+
+
+def test_toggle_todo_completion_does_not_reload(todo_service, sample_todo_data, statements):
+    """Test that toggling loads the row once and does not SELECT it again after commit."""
+    created_todo = todo_service.create_todo(sample_todo_data)
+    statements.clear()
+
+    if created_todo.id is not None:
+        todo_service.toggle_todo_completion(created_todo.id)
+
+    assert statements == ["SELECT", "UPDATE"]
+
+
+def test_timestamps_available_without_reload(todo_service, sample_todo_data, statements):
+    """Test that server-generated timestamps are loaded on the returned, detached objects."""
+    created_todo = todo_service.create_todo(sample_todo_data)
+    assert created_todo.id is not None
+    toggled_todo = todo_service.toggle_todo_completion(created_todo.id)
+    statements.clear()
+
+    assert toggled_todo is not None
+    for value in (created_todo.created_at, created_todo.updated_at, toggled_todo.updated_at):
+        assert isinstance(value, datetime)
+        # Naive UTC on every backend
+        assert value.tzinfo is None
+    assert toggled_todo.updated_at > created_todo.updated_at
+    assert statements == []
+
+
+def test_raw_update_advances_updated_at(todo_service, sample_todo_data):
+    """Test that the database trigger bumps updated_at for writes made outside the ORM."""
+    created_todo = todo_service.create_todo(sample_todo_data)
+    assert created_todo.id is not None
+    time.sleep(0.01)
+
+    with ENGINE.begin() as conn:
+        conn.execute(text("UPDATE todo_items SET title = 'Raw' WHERE id = :id"), {"id": created_todo.id})
+
+    updated_todo = todo_service.get_todo_by_id(created_todo.id)
+    assert updated_todo is not None
+    assert updated_todo.title == "Raw"
+    assert updated_todo.updated_at > created_todo.updated_at
+    assert updated_todo.created_at == created_todo.created_at